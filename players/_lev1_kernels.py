@@ -0,0 +1,93 @@
+"""
+Bit-twiddling kernels for LevBot's draw and board-texture checks.
+
+Each hand is packed into one integer: 16 bits per suit, with a card at
+bit (suit_index * 16 + rank.value - 2). The kernels are plain module-level
+functions over that mask - no instance state, just integer bit ops - so
+they stay standard-library only and avoid bound-method dispatch on the
+per-decision hot path.
+"""
+import random
+from typing import List
+
+from engine.cards import Card, Rank, Suit
+
+
+_SUIT_INDEX = {suit: index for index, suit in enumerate(Suit)}
+_SUIT_SLICE = 0x1FFF  # the 13 rank bits of one suit slice
+
+# Four-in-a-row rank patterns for open-ended straight draws, plus the A-2-3-4 wheel draw
+FOUR_STRAIGHT_PATTERNS = tuple(0b1111 << i for i in range(10)) + (0b1000000000111,)
+
+# Bit position of every card in the packed hand mask, built once for the full deck
+_CARD_CODE = {
+    Card(rank, suit): _SUIT_INDEX[suit] * 16 + rank.value - 2
+    for rank in Rank for suit in Suit
+}
+
+
+def pack_cards(cards: List[Card]) -> int:
+    """OR a list of cards into one packed hand mask"""
+    mask = 0
+    for card in cards:
+        mask |= 1 << _CARD_CODE[card]
+    return mask
+
+
+class BatchRNG:
+    """Amortized random draws for tight simulation loops.
+
+    Pulls a whole chunk of 32-bit words out of random.Random with a single
+    getrandbits call and hands them out one at a time, so a Monte Carlo run
+    pays one generator invocation per chunk instead of one per decision.
+    """
+
+    def __init__(self, chunk: int = 1024, seed=None):
+        self._random = random.Random(seed)
+        self._chunk = chunk
+        self._bits = 0
+        self._remaining = 0
+
+    def next_u32(self) -> int:
+        """Next uniform 32-bit integer, for comparison against scaled thresholds"""
+        if self._remaining == 0:
+            self._bits = self._random.getrandbits(32 * self._chunk)
+            self._remaining = self._chunk
+        word = self._bits & 0xFFFFFFFF
+        self._bits >>= 32
+        self._remaining -= 1
+        return word
+
+
+def _scan_mask(mask: int):
+    """One pass over the four suit slices: (most cards in one suit, 13-bit rank mask)"""
+    max_suit = 0
+    rank_mask = 0
+    for suit in range(4):
+        suit_bits = (mask >> (suit * 16)) & _SUIT_SLICE
+        count = bin(suit_bits).count('1')
+        if count > max_suit:
+            max_suit = count
+        rank_mask |= suit_bits
+    return max_suit, rank_mask
+
+
+def _is_open_ended(rank_mask: int) -> bool:
+    """Four ranks in a row (or the wheel draw)"""
+    return any(rank_mask & pattern == pattern for pattern in FOUR_STRAIGHT_PATTERNS)
+
+
+def has_strong_draw(mask: int) -> bool:
+    """Check a packed hand for strong draws (flush or open-ended straight)"""
+    max_suit, rank_mask = _scan_mask(mask)
+    return max_suit >= 4 or _is_open_ended(rank_mask)
+
+
+def is_strong_pot(mask: int) -> bool:
+    """Check a packed board for textures that could already beat us
+
+    Three of one suit means someone could have a flush; four ranks in a
+    row means someone could be on a straight.
+    """
+    max_suit, rank_mask = _scan_mask(mask)
+    return max_suit >= 3 or _is_open_ended(rank_mask)
@@ -2,6 +2,7 @@
 Aggressive Bot - Plays loose and aggressive
 Bets and raises frequently, plays many hands
 """
+from collections import Counter
 from typing import List, Dict, Any
 import random
 
@@ -11,6 +12,11 @@ from engine.cards import Card, Rank, HandEvaluator
 from engine.poker_game import GameState
 
 
+# Wheel straight draws, hoisted so the draw check doesn't rebuild them per card
+WHEEL_LOW = frozenset((2, 3, 4, 5))
+WHEEL_HIGH = frozenset((14, 2, 3, 4))
+
+
 class AggressiveBot(PokerBotAPI):
     """
     An aggressive bot that plays loose and raises frequently.
@@ -125,19 +131,19 @@ class AggressiveBot(PokerBotAPI):
 
     def _has_strong_draw(self, all_cards: List[Card]) -> bool:
         """Check for strong drawing hands (flush or open-ended straight)"""
-        # Flush draw
-        suits = [card.suit for card in all_cards]
-        for suit in set(suits):
-            if suits.count(suit) == 4:
-                return True
+        # Flush draw: one tally pass instead of a count() scan per distinct suit
+        suit_counts = Counter(card.suit for card in all_cards)
+        if 4 in suit_counts.values():
+            return True
         
         # Open-ended straight draw
-        ranks = sorted(list(set(card.rank.value for card in all_cards)))
+        rank_set = set(card.rank.value for card in all_cards)
+        if rank_set.issuperset(WHEEL_LOW) or rank_set.issuperset(WHEEL_HIGH):
+            return True
+        ranks = sorted(rank_set)
         for i in range(len(ranks) - 3):
-            if ranks[i+3] - ranks[i] == 3 and len(ranks) >=4 :
+            if ranks[i+3] - ranks[i] == 3:
                 return True
-            if set(ranks).issuperset({2,3,4,5}) or set(ranks).issuperset({14,2,3,4}):
-                 return True
         return False
     
     def hand_complete(self, game_state: GameState, hand_result: Dict[str, Any]):
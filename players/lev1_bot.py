@@ -1,16 +1,29 @@
 from typing import List, Dict, Any
-import random
 
 
 from bot_api import PokerBotAPI, PlayerAction, GameInfoAPI
 from engine.cards import Card, Rank, HandEvaluator
 from engine.poker_game import GameState
+from players import _lev1_kernels
+
+
+# Hand-strength thresholds cached once; HAND_RANKINGS never changes
+PAIR_RANK = HandEvaluator.HAND_RANKINGS['pair']
+TRIPS_RANK = HandEvaluator.HAND_RANKINGS['three_of_a_kind']
 
 
 class LevBot(PokerBotAPI):
 
+    # Strong starting hands as unordered rank sets, so checking one is a single
+    # hash lookup; class-level so the table is built once no matter how many
+    # bot instances a simulation spins up
+    premium_hands = frozenset(frozenset(hand) for hand in [
+        (Rank.ACE, Rank.ACE), (Rank.KING, Rank.KING), (Rank.QUEEN, Rank.QUEEN),
+        (Rank.JACK, Rank.JACK), (Rank.TEN, Rank.TEN), (Rank.NINE, Rank.NINE),
+        (Rank.ACE, Rank.KING), (Rank.ACE, Rank.QUEEN), (Rank.ACE, Rank.JACK),
+        (Rank.KING, Rank.QUEEN), (Rank.KING, Rank.JACK), (Rank.QUEEN, Rank.JACK)
+    ])
 
-    
     def __init__(self, name: str):
         super().__init__(name)
         self.bot_name = "lev1_bot"
@@ -24,22 +37,21 @@ class LevBot(PokerBotAPI):
         
         """postflop variables"""
         # variables that determine playing and raising and stuff
+        self.good_hand_raise_rate = 1.0 # chance to raise a good (pair+) hand on a safe board
 
+        # Batched RNG plus integer thresholds: next_u32() < threshold is the
+        # same test as random() < rate but skips the float conversion per call
+        # and amortizes generator invocations across a whole chunk of draws
+        self._rng = _lev1_kernels.BatchRNG()
+        self._good_hand_raise_threshold = int(self.good_hand_raise_rate * (1 << 32))
 
-        
+        # Best-hand results keyed by packed 7-card mask; the board rarely changes
+        # between decisions on the same street, so repeat probes are one dict hit
+        self._eval_cache = {}
 
         ##self.bluff_rate = 0.5 no bluffing, yet
 
 
-        # Define strong starting hands
-        self.premium_hands = [
-            (Rank.ACE, Rank.ACE), (Rank.KING, Rank.KING), (Rank.QUEEN, Rank.QUEEN),
-            (Rank.JACK, Rank.JACK), (Rank.TEN, Rank.TEN), (Rank.NINE, Rank.NINE),
-            (Rank.ACE, Rank.KING), (Rank.ACE, Rank.QUEEN), (Rank.ACE, Rank.JACK),
-            (Rank.KING, Rank.QUEEN), (Rank.KING, Rank.JACK), (Rank.QUEEN, Rank.JACK)
-        ]
-    
-
 
 
 
@@ -67,6 +79,9 @@ class LevBot(PokerBotAPI):
             return (PlayerAction.ALL_IN, 0)
         """
 
+        # frozenset makes every `in legal_actions` check below O(1)
+        legal_actions = frozenset(legal_actions)
+
         if game_state.round_name == "preflop":
             return self._preflop_strategy(game_state, hole_cards, legal_actions, min_bet, max_bet)
         else:
@@ -109,10 +124,11 @@ class LevBot(PokerBotAPI):
 
 
             raise_amount = game_state.pot * multiplyer # bruh idk, jsut big nuber
-            raise_amount = self._clamp_raise_amount(game_state, min_bet, max_bet, raise_amount)
-                
-            if self._apply_raise_amount_if_able(game_state, legal_actions, raise_amount) != None:
-                return self._apply_raise_amount_if_able(game_state, legal_actions, raise_amount)
+            raise_amount = max(min_bet, min(raise_amount, max_bet))
+
+            action = self._apply_raise_amount_if_able(game_state, legal_actions, raise_amount)
+            if action is not None:
+                return action
         else:
             if PlayerAction.CALL in legal_actions:
                     return PlayerAction.CALL, 0
@@ -131,15 +147,25 @@ class LevBot(PokerBotAPI):
     def _postflop_strategy(self, game_state: GameState, hole_cards: List[Card], 
                            legal_actions: List[PlayerAction], min_bet: int, max_bet: int) -> tuple:
         """Aggressive post-flop strategy"""
-        all_cards = hole_cards + game_state.community_cards
-        hand_type, _, _ = HandEvaluator.evaluate_best_hand(all_cards)
+        # Locals are LOAD_FAST; these attributes get touched several times below
+        community_cards = game_state.community_cards
+        pot = game_state.pot
+
+        # Pack the board once and reuse it for the full-hand mask
+        board_mask = _lev1_kernels.pack_cards(community_cards)
+        hand_mask = board_mask | _lev1_kernels.pack_cards(hole_cards)
+        strong_draw = _lev1_kernels.has_strong_draw(hand_mask)
+        strong_pot = _lev1_kernels.is_strong_pot(board_mask)
+
+        evaluation = self._eval_cache.get(hand_mask)
+        if evaluation is None:
+            evaluation = HandEvaluator.evaluate_best_hand(hole_cards + community_cards)
+            self._eval_cache[hand_mask] = evaluation
+        hand_type, _, _ = evaluation
         hand_rank = HandEvaluator.HAND_RANKINGS[hand_type]
 
-        strong_draw = self._has_strong_draw(all_cards)
-        strong_pot = self._is_strong_pot(game_state.community_cards)
-
-        good_hand_rank = hand_rank >= HandEvaluator.HAND_RANKINGS['pair']
-        great_hand_rank = hand_rank >= HandEvaluator.HAND_RANKINGS['three_of_a_kind']
+        good_hand_rank = hand_rank >= PAIR_RANK
+        great_hand_rank = hand_rank >= TRIPS_RANK
 
 
         # checking two varaibles, to change play stuff based on that
@@ -148,11 +174,11 @@ class LevBot(PokerBotAPI):
                 return PlayerAction.CALL, 0
             if PlayerAction.CHECK in legal_actions:
                 return PlayerAction.CHECK, 0
-        if good_hand_rank and strong_pot and game_state.community_cards.count < 5:
+        if good_hand_rank and strong_pot and len(community_cards) < 5:
             if PlayerAction.CHECK in legal_actions:
                 return PlayerAction.CHECK, 0
         # potential to be fine    
-        if strong_draw and strong_pot and game_state.community_cards.count < 3:
+        if strong_draw and strong_pot and len(community_cards) < 3:
             if PlayerAction.CHECK in legal_actions:
                 return PlayerAction.CHECK, 0
         
@@ -161,23 +187,23 @@ class LevBot(PokerBotAPI):
         # Great hand (three of a kind or better)
         if great_hand_rank and not strong_pot:
             if PlayerAction.RAISE in legal_actions:
-                raise_amount = (game_state.pot * self.raise_amount_multiplier)
-                raise_amount = self._clamp_raise_amount(game_state, min_bet, max_bet, raise_amount)
+                raise_amount = (pot * self.raise_amount_multiplier)
+                raise_amount = max(min_bet, min(raise_amount, max_bet))
                 return PlayerAction.RAISE, raise_amount
 
 
         # Strong hand (top pair or better)
         if good_hand_rank and not strong_pot:
-            if PlayerAction.RAISE in legal_actions and random.random() < good_hand_rank:
-                raise_amount = (game_state.pot * self.raise_amount_multiplier)
-                raise_amount = self._clamp_raise_amount(game_state, min_bet, max_bet, raise_amount)
+            if PlayerAction.RAISE in legal_actions and self._rng.next_u32() < self._good_hand_raise_threshold:
+                raise_amount = (pot * self.raise_amount_multiplier)
+                raise_amount = max(min_bet, min(raise_amount, max_bet))
                 return PlayerAction.RAISE, raise_amount
 
 
 
 
             
-        if hand_rank < HandEvaluator.HAND_RANKINGS['pair']:
+        if hand_rank < PAIR_RANK:
             if PlayerAction.FOLD in legal_actions:
                 return PlayerAction.FOLD, 0
         
@@ -213,8 +239,9 @@ class LevBot(PokerBotAPI):
 
 
     """
-    if self._apply_raise_amount_if_able(game_state, legal_actions, raise_amount) != None:
-        return self._apply_raise_amount_if_able(game_state, legal_actions, raise_amount)
+    action = self._apply_raise_amount_if_able(game_state, legal_actions, raise_amount)
+    if action is not None:
+        return action
     """
     def _apply_raise_amount_if_able(self, game_state: GameState, legal_actions: List[PlayerAction], raise_amount: float) -> PlayerAction:
         if raise_amount > game_state.current_bet:
@@ -227,63 +254,18 @@ class LevBot(PokerBotAPI):
 
 
 
-    def _has_strong_draw(self, all_cards: List[Card]) -> bool:
-        """Check for strong drawing hands (flush or open-ended straight)"""
-        # Flush draw
-        suits = [card.suit for card in all_cards]
-        for suit in set(suits):
-            if suits.count(suit) == 4:
-                return True
-        
-        # Open-ended straight draw
-        ranks = sorted(list(set(card.rank.value for card in all_cards)))
-        for i in range(len(ranks) - 3):
-            if ranks[i+3] - ranks[i] == 3 and len(ranks) >=4 :
-                return True
-            if set(ranks).issuperset({2,3,4,5}) or set(ranks).issuperset({14,2,3,4}):
-                 return True
-        return False
-    
-    def _is_strong_pot(self, community_cards):
-        # Check if there is 3 of the same suit, it is dangerous for us to play because someone could have a flush
-        suits = [card.suit for card in community_cards]
-        for suit in set(suits):
-            if suits.count(suit) == 3 or suits.count(suit) == 4:
-                return True
-
-        # Open-ended straight draw
-        ranks = sorted(list(set(card.rank.value for card in community_cards)))
-        for i in range(len(ranks) - 3):
-            if ranks[i+3] - ranks[i] == 3 and len(ranks) >=4 :
-                return True
-            if set(ranks).issuperset({2,3,4,5}) or set(ranks).issuperset({14,2,3,4}):
-                 return True
-        return False
-    
     def _is_premium_starting_hand(self, hole_cards: List[Card]) -> bool:
-        card1, card2 = hole_cards
-        
-        # Check if we have a premium hand
-        hand_tuple1 = (card1.rank, card2.rank)
-        hand_tuple2 = (card2.rank, card1.rank)  # Check both orders
-
-        return (hand_tuple1 in self.premium_hands or 
-                     hand_tuple2 in self.premium_hands)
+        # A pocket pair collapses to a single-element frozenset, which still
+        # matches its pair entry, so no need to check both card orders
+        return frozenset((hole_cards[0].rank, hole_cards[1].rank)) in self.premium_hands
     
     
     def _is_pair_starting_hand(self, hold_hards: List[Card]) -> bool:
         card1, card2 = hold_hards
 
-        return (card1.rank == card2.rank)
+        # Rank members are singletons, so identity is the cheapest equality
+        return card1.rank is card2.rank
     
-    def _clamp_raise_amount(self, game_state: GameState, min_bet: float, max_bet: float, amount: float) -> float:
-        # Bet half pot on a draw
-        raise_amount = min(amount, max_bet)
-        raise_amount = max(raise_amount, min_bet)
-        
-        return raise_amount
-
-
     def hand_complete(self, game_state: GameState, hand_result: Dict[str, any]):
         """
         Called when a hand is complete. Use this to learn from the results.
@@ -296,7 +278,8 @@ class LevBot(PokerBotAPI):
                 - 'pot_distribution': Dict of player -> winnings
                 - 'showdown_hands': Dict of all revealed hands (if showdown)
         """
-        pass
+        # Cached evaluations are only valid within one hand
+        self._eval_cache.clear()
 
     def tournament_start(self, players: List[str], starting_chips: int):
         super().tournament_start(players, starting_chips)